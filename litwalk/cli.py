@@ -1,6 +1,7 @@
 """
 lit-walk CLI
 """
+import functools
 import json
 import os
 import re
@@ -8,11 +9,9 @@ import sys
 import datetime
 import logging
 import shutil
-import yaml
 import click
 from typing import Any
 from litwalk import LitWalk
-from litwalk.views import NotesView
 from rich import print
 from rich.padding import Padding
 from rich.table import Table
@@ -37,6 +36,21 @@ else:
 
 default_config_path = os.path.join(conf_dir, "config.yml")
 
+@functools.lru_cache(maxsize=4)
+def _load_config(path:str, mtime:float) -> dict[str, Any]:
+    """
+    Parses a lit-walk config file; memoized on path + mtime so that repeated in-process
+    invocations don't re-parse an unchanged file
+    """
+    # defer loading yaml until the config is actually read
+    import yaml
+
+    # prefer the libyaml-backed loader when available; the config only uses plain tags
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    with open(path, "rt", encoding="utf-8") as fp:
+        return yaml.load(fp, Loader=loader)
+
 @click.group()
 @click.option("--config", default=default_config_path, help="Path to lit-walk config file to use")
 @click.option("--verbose", is_flag=True, help="If enabled, prints verbose output")
@@ -52,8 +66,7 @@ def cli(ctx, config:str, verbose:bool):
 
     # copy default config, if none found
     if not os.path.exists(config):
-        if not os.path.exists(conf_dir):
-            os.makedirs(conf_dir, mode=0o755)
+        os.makedirs(conf_dir, mode=0o755, exist_ok=True)
 
         default_cfg = os.path.join(os.path.abspath(
             resource_filename(__name__, "conf")), "default.yml")
@@ -62,8 +75,7 @@ def cli(ctx, config:str, verbose:bool):
 
     config = os.path.expanduser(config)
 
-    with open(config, "rt", encoding="utf-8") as fp:
-        cfg = yaml.load(fp, Loader=yaml.FullLoader)
+    cfg = _load_config(config, os.path.getmtime(config))
 
     # initialize lit
     ctx.obj = LitWalk(verbose=verbose, **cfg)
@@ -110,6 +122,9 @@ def info(litwalk):
 @click.pass_obj
 def notes(litwalk):
     """Take notes on an article"""
+    # defer loading textual & friends until the TUI is actually launched
+    from litwalk.views import NotesView
+
     articles = litwalk.get_articles()
     view = NotesView(articles, litwalk.get_notes_dir())
     view.run()
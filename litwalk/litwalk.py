@@ -10,9 +10,7 @@ import re
 import sqlite3
 import string
 import sys
-import bibtexparser
-from typing import Any, TypedDict
-from bibtexparser.bparser import BibTexParser
+from typing import Any, Iterator, TypedDict
 from rich import print
 
 __version__ = "0.3.0"
@@ -22,6 +20,56 @@ class ArticleResult(TypedDict):
     num_included: int
     num_total: int
 
+# translation table used to convert newlines/tabs in article fields to spaces
+_WS_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# regexes used to cheaply pre-scan raw bibtex entries prior to a full parse;
+# entry blocks are assumed to start with "@" at the beginning of a line
+_BIB_ENTRY_SPLIT_RE = re.compile(r"(?m)^(?=@)")
+_BIB_TITLE_RE = re.compile(r'(?im)^\s*title\s*=\s*[{"](.*?)[}"]\s*,?\s*$', re.S)
+_BIB_ABSTRACT_RE = re.compile(r'(?im)^\s*abstract\s*=\s*[{"](.*?)[}"]\s*,?\s*$', re.S)
+_BIB_CONT_WS_RE = re.compile(r"[ \t]*\n[ \t]*")
+
+# regexes used when constructing note paths;
+# slug pattern adapted from: https://github.com/django/django/blob/main/django/utils/text.py
+_SLUG_RE = re.compile(r"(?u)[^-\w.]")
+_MD_EXT_RE = re.compile(r"\.md$")
+
+# frequently-used SQL statements, hoisted so that repeated calls reuse the same
+# string and hit sqlite3's prepared statement cache
+_INSERT_ARTICLE_SQL = '''INSERT OR IGNORE INTO articles(doi, isbn, issn, pmc, pmid, arxivid, title,
+                                              abstract, note, booktitle, edition, entrytype,
+                                              journal, keywords, pages, author, volume, number,
+                                              url, year, month, md5)
+                            VALUES(:doi, :isbn, :issn, :pmc, :pmid, :arxivid, :title, :abstract,
+                                   :note, :booktitle, :edition, :entrytype, :journal, :keywords,
+                                   :pages, :author, :volume, :number, :url, :year, :month, :md5)'''
+
+_INFO_COUNTS_SQL = """SELECT COUNT(*), SUM(doi IS NULL), SUM(abstract IS NULL),
+                             SUM(keywords IS NULL) FROM articles"""
+
+_SEARCH_WHERE_SQL = """lower(abstract) LIKE ? ESCAPE '\\' OR lower(author) LIKE ? ESCAPE '\\' OR
+                       lower(keywords) LIKE ? ESCAPE '\\' OR lower(title) LIKE ? ESCAPE '\\'"""
+
+# batch size above which keyword normalization switches to pandas' vectorized string
+# ops; below this, per-article processing is faster than the pandas overhead
+_KEYWORD_VECTORIZE_MIN = 100
+
+# number of rows passed to executemany at a time during bulk inserts, to bound memory
+# on very large imports
+_INSERT_CHUNK_SIZE = 500
+
+# number of entries above which md5 hashing is spread across threads; hashlib releases
+# the GIL for large inputs, so abstracts hash in parallel
+_HASH_PARALLEL_MIN = 1000
+
+
+def _article_md5(article:dict[str, str]) -> str:
+    """Computes the md5 hash of an article's title + abstract"""
+    hash_input = (article.get("title", "") + article.get("abstract", "")).encode("utf-8")
+
+    return hashlib.md5(hash_input).hexdigest()
+
 # activity codes
 ACTIVITY_ADD = 0
 ACTIVITY_VIEW = 1
@@ -44,8 +92,19 @@ class LitWalk:
         verbose: bool
             If True, verbose logging is enabled
         """
-        self.data_dir = data_dir
-        self.notes_dir = notes_dir
+        # cache of resolved paths, to avoid repeating the expand/realpath syscall chain
+        self._paths:dict[str, str] = {}
+
+        # cached article count; invalidated whenever articles are added or removed
+        self._num_articles_cache:int|None = None
+
+        # cache of full-table get_articles results, keyed on a version counter that is
+        # bumped by every write so stale results are never served
+        self._articles_cache:dict[tuple[bool, int], list[dict[str, Any]]] = {}
+        self._version = 0
+
+        self.data_dir = self._resolve(data_dir)
+        self.notes_dir = self._resolve(notes_dir)
         self.dev_mode = dev_mode
         self.dev_mode_subsample = dev_mode_subsample
         self.verbose = verbose
@@ -54,11 +113,8 @@ class LitWalk:
         self._setup_logger()
 
         # create data and notes directories, if needed
-        if not os.path.exists(self.data_dir):
-            os.makedirs(os.path.expanduser(self.data_dir), mode=0o755)
-
-        if not os.path.exists(self.notes_dir):
-            os.makedirs(os.path.expanduser(self.notes_dir), mode=0o755)
+        os.makedirs(self.data_dir, mode=0o755, exist_ok=True)
+        os.makedirs(self.notes_dir, mode=0o755, exist_ok=True)
 
         # initialize database
         self._init_db()
@@ -67,6 +123,16 @@ class LitWalk:
         """Returns path to base user notes directory"""
         return self.notes_dir
 
+    def _resolve(self, path:str) -> str:
+        """
+        Expands and resolves a path, caching the result so that repeated lookups avoid
+        the underlying stat calls
+        """
+        if path not in self._paths:
+            self._paths[path] = os.path.realpath(os.path.expanduser(os.path.expandvars(path)))
+
+        return self._paths[path]
+
     def _setup_logger(self):
         """
         Sets up logger to print messages to STDOUT
@@ -87,15 +153,33 @@ class LitWalk:
 
         If the database does not already exist, it will be created.
         """
-        dbpath = os.path.join(self.data_dir, 'db.sqlite')
-        dbpath = os.path.realpath(os.path.expanduser(os.path.expandvars(dbpath)))
+        dbpath = self._resolve(os.path.join(self.data_dir, 'db.sqlite'))
 
         # connect to db
         try:
-            self.db = sqlite3.connect(dbpath)
+            # isolation_level=None leaves the connection in autocommit mode;
+            # bulk operations manage their own transactions explicitly
+            self.db = sqlite3.connect(dbpath, cached_statements=256, isolation_level=None)
+
+            # C-level name->column mapping; avoids building colname lists and zipping
+            # per-row in every fetch path
+            self.db.row_factory = sqlite3.Row
         except sqlite3.Error as exception:
             print(exception)
 
+        # tune for a local single-writer workload: WAL + NORMAL synchronous cut commit
+        # latency, and the larger page cache / mmap help read-heavy paths; each pragma
+        # is advisory, so failures are simply ignored
+        for pragma in ["PRAGMA journal_mode=WAL;",
+                       "PRAGMA synchronous=NORMAL;",
+                       "PRAGMA temp_store=MEMORY;",
+                       "PRAGMA cache_size=-65536;",
+                       "PRAGMA mmap_size=268435456;"]:
+            try:
+                self.db.execute(pragma)
+            except sqlite3.Error:
+                pass
+
         cursor = self.db.cursor()
 
         # get a list of tables in the db
@@ -114,8 +198,70 @@ class LitWalk:
         if "articleAnnot" not in tables:
             self._create_article_annot_table(cursor)
 
+        # dedup by md5 happens in the B-tree itself (INSERT OR IGNORE), rather than
+        # requiring a python-side membership check
+        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_md5 ON articles(md5);")
+
+        # speeds up the note-path collision lookups performed during imports
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_note ON articles(note);")
+
+        # partial indexes so missing-metadata queries scale with the number of missing
+        # rows rather than the size of the collection
+        cursor.execute("""CREATE INDEX IF NOT EXISTS idx_articles_missing_abstract
+                          ON articles(id) WHERE abstract IS NULL;""")
+        cursor.execute("""CREATE INDEX IF NOT EXISTS idx_articles_missing_doi
+                          ON articles(id) WHERE doi IS NULL;""")
+        cursor.execute("""CREATE INDEX IF NOT EXISTS idx_articles_missing_keywords
+                          ON articles(id) WHERE keywords IS NULL;""")
+
+        self._init_fts(cursor, "articles_fts" in tables)
+
         cursor.close()
 
+    def _init_fts(self, cursor:sqlite3.Cursor, fts_exists:bool):
+        """
+        Creates a full-text index over the searched article fields, kept in sync with
+        the articles table via triggers.
+
+        If sqlite was built without FTS5 support, searches fall back to LIKE scans.
+        """
+        try:
+            cursor.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                                  title, abstract, author, keywords,
+                                  content='articles', content_rowid='id');""")
+        except sqlite3.OperationalError:
+            self._logger.warn("FTS5 unavailable; falling back to unindexed search")
+            self._has_fts = False
+            return
+
+        cursor.execute("""CREATE TRIGGER IF NOT EXISTS articles_fts_ai
+                          AFTER INSERT ON articles BEGIN
+                              INSERT INTO articles_fts(rowid, title, abstract, author, keywords)
+                              VALUES (new.id, new.title, new.abstract, new.author, new.keywords);
+                          END;""")
+        cursor.execute("""CREATE TRIGGER IF NOT EXISTS articles_fts_ad
+                          AFTER DELETE ON articles BEGIN
+                              INSERT INTO articles_fts(articles_fts, rowid, title, abstract,
+                                                       author, keywords)
+                              VALUES ('delete', old.id, old.title, old.abstract, old.author,
+                                      old.keywords);
+                          END;""")
+        cursor.execute("""CREATE TRIGGER IF NOT EXISTS articles_fts_au
+                          AFTER UPDATE ON articles BEGIN
+                              INSERT INTO articles_fts(articles_fts, rowid, title, abstract,
+                                                       author, keywords)
+                              VALUES ('delete', old.id, old.title, old.abstract, old.author,
+                                      old.keywords);
+                              INSERT INTO articles_fts(rowid, title, abstract, author, keywords)
+                              VALUES (new.id, new.title, new.abstract, new.author, new.keywords);
+                          END;""")
+
+        # index any articles added before the fts table existed
+        if not fts_exists:
+            cursor.execute("INSERT INTO articles_fts(articles_fts) VALUES('rebuild');")
+
+        self._has_fts = True
+
     def _create_articles_table(self, cursor:sqlite3.Cursor):
         """
         Creates articles table.
@@ -215,18 +361,42 @@ class LitWalk:
         except sqlite3.Error as e:
             print(e)
 
-    def get_md5s(self, cursor:sqlite3.Cursor) -> list[str]:
+    def get_md5s(self, cursor:sqlite3.Cursor) -> set[str]:
         """
-        Returns a list of existing md5sums in the database
+        Returns the set of existing md5sums in the database
         """
         cursor.execute("SELECT md5 FROM articles")
 
-        return [x[0] for x in cursor.fetchall()]
+        return {x[0] for x in cursor.fetchall()}
 
     def get_articles(self, n=None, missing_abstracts=False) -> list[dict[str, Any]]:
         """
         Retrieves articles table
 
+        Parameters
+        ----------
+        n: int|None
+            Number of articles to retrieve; if "None", returns all (default: None)
+        missing_abstracts: bool
+            If true, only include articles with missing abstracts (default: False)
+        """
+        # random subsets (n != None) are never cached, so repeated draws stay random
+        if n is not None:
+            return list(self.iter_articles(n=n, missing_abstracts=missing_abstracts))
+
+        key = (missing_abstracts, self._version)
+
+        if key not in self._articles_cache:
+            self._articles_cache.clear()
+            self._articles_cache[key] = list(self.iter_articles(missing_abstracts=missing_abstracts))
+
+        return self._articles_cache[key]
+
+    def iter_articles(self, n=None, missing_abstracts=False) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over articles in the articles table, streaming rows in batches so that
+        callers which don't need the full list at once stay memory-bound
+
         Parameters
         ----------
         n: int|None
@@ -239,34 +409,40 @@ class LitWalk:
         # all articles
         if n is None:
             if missing_abstracts:
-                sql = "SELECT * FROM articles WHERE abstract IS NULL;"
+                res = cursor.execute("SELECT * FROM articles WHERE abstract IS NULL;")
             else:
-                sql = "SELECT * FROM articles;"
+                res = cursor.execute("SELECT * FROM articles;")
         else:
             if self.dev_mode:
                 n = min(n, self.dev_mode_subsample)
 
-            # subset of articles
+            # subset of articles; sampling ids in python avoids the full-table sort that
+            # ORDER BY RANDOM() would perform -- only the id column is scanned
             if missing_abstracts:
-                sql = f"""SELECT * FROM articles WHERE id IN
-                           (SELECT id FROM articles WHERE abstract IS NULL
-                            ORDER BY RANDOM() LIMIT {n})"""
+                id_sql = "SELECT id FROM articles WHERE abstract IS NULL"
             else:
-                sql = f"""SELECT * FROM articles WHERE id IN (SELECT id FROM articles ORDER BY
-                                                              RANDOM() LIMIT {n})"""
+                id_sql = "SELECT id FROM articles"
 
-        res = cursor.execute(sql)
+            ids = [row[0] for row in self.db.execute(id_sql)]
+            sampled = random.sample(ids, min(n, len(ids)))
 
-        articles = cursor.fetchall()
+            if len(sampled) == 0:
+                cursor.close()
+                return
 
-        colnames = [x[0] for x in res.description]
+            placeholders = ", ".join("?" * len(sampled))
+            cursor.execute(f"SELECT * FROM articles WHERE id IN ({placeholders})", sampled)
 
-        article_dicts = []
+        while True:
+            rows = cursor.fetchmany(1000)
 
-        for article in articles:
-            article_dicts.append(dict(zip(colnames, article)))
+            if not rows:
+                break
 
-        return article_dicts
+            for row in rows:
+                yield dict(row)
+
+        cursor.close()
 
     def walk(self, search=""):
         """Chooses an article at random"""
@@ -286,27 +462,53 @@ class LitWalk:
         Gets a single random article, limited to those matching some specified search
         phrase
         """
-        articles = self.get_articles()
-
-        filtered = []
+        num_articles = self.num_articles()
 
-        num_articles = len(articles)
+        # filter and choose the article inside sqlite, rather than scanning every row in
+        # python; comparison is forced to be case-insensitive, for now
+        # the candidate count is folded into the same statement as the random pick, so
+        # each search is a single round-trip
+        # "%"/"_" are escaped so user input matches as a literal substring rather than
+        # as LIKE wildcards
+        pat = "%" + (search.lower()
+                     .replace("\\", "\\\\")
+                     .replace("%", "\\%")
+                     .replace("_", "\\_")) + "%"
+
+        if self._has_fts:
+            # fts prefix queries only match at token boundaries, so the index hits are
+            # unioned with the substring scan to keep interior matches (e.g. "network"
+            # in "subnetworks") counted and reachable. the phrase is quoted so that
+            # user input is matched literally instead of being interpreted as fts query
+            # syntax; the trailing "*" makes the final token a prefix query, so
+            # partial-word searches like "learn" still match "learning"
+            phrase = '"' + search.replace('"', '""') + '"*'
+
+            where_sql = f"""id IN (SELECT rowid FROM articles_fts
+                                    WHERE articles_fts MATCH ?)
+                            OR {_SEARCH_WHERE_SQL}"""
+            params = (phrase, pat, pat, pat, pat)
+        else:
+            where_sql = _SEARCH_WHERE_SQL
+            params = (pat,) * 4
 
-        # force case-insensitive comparison, for now.
-        search = search.lower()
+        query = self.db.execute(
+            f"""SELECT *,
+                       (SELECT COUNT(*) FROM articles
+                         WHERE {where_sql}) AS num_included
+                  FROM articles WHERE {where_sql}
+                 ORDER BY RANDOM() LIMIT 1""", params * 2)
 
-        for article in articles:
-            for field in ['abstract', 'author', 'keywords', 'title']:
-                if article[field] is None:
-                    continue
+        row = query.fetchone()
 
-                if search in article[field].lower():
-                    filtered.append(article)
+        if row is None:
+            raise Exception("No matching articles found!")
 
-        num_filtered = len(filtered)
+        chosen = dict(row)
+        num_filtered = chosen.pop("num_included")
 
         res:ArticleResult = {
-            "article": random.sample(filtered, 1)[0],
+            "article": chosen,
             "num_included": num_filtered,
             "num_total": num_articles
         }
@@ -317,20 +519,16 @@ class LitWalk:
         """
         Gets a single random article from among all articles
         """
-        cursor = self.db.cursor()
-
         num_articles = self.num_articles()
 
         if num_articles == 0:
             raise Exception("No articles found!")
 
-        ind = random.randint(1, num_articles)
-
-        res = cursor.execute(f"SELECT * FROM articles WHERE id={ind};")
-        article = cursor.fetchall()[0]
-        colnames = [x[0] for x in res.description]
-        article = dict(zip(colnames, article))
-        cursor.close()
+        # offset-based selection works regardless of gaps in the id sequence left by
+        # deleted articles
+        res = self.db.execute("SELECT * FROM articles LIMIT 1 OFFSET ?;",
+                              (random.randrange(num_articles),))
+        article = dict(res.fetchone())
 
         res:ArticleResult = {
             "article": article,
@@ -344,25 +542,42 @@ class LitWalk:
         """
         Add entry to activity table
         """
-        cursor = self.db.cursor()
-
-        res = cursor.execute("INSERT INTO activity(entity_id, date, action) VALUES (?, ?, ?);",
-                             (entity_id, datetime.datetime.now(), action))
-        self.db.commit()
-        cursor.close()
+        # the connection is in autocommit mode, so the insert is durable on its own; no
+        # explicit commit needed
+        self.db.execute("INSERT INTO activity(entity_id, date, action) VALUES (?, ?, ?);",
+                        (entity_id, datetime.datetime.now(), action))
 
     def import_bibtex(self, infile:str):
         """
         Imports and parses a bibtex reference file
         """
+        # defer loading bibtexparser until needed; most commands never import references
+        import bibtexparser
+        from bibtexparser.bparser import BibTexParser
+
         self._logger.info(f"Importing references from BibTeX file: {infile}")
 
         if not os.path.exists(infile):
             raise Exception("No Bibtex file found at specified path!")
 
-        with open(infile) as bibtex_file:
-            parser = BibTexParser(common_strings = True)
-            bibtex = bibtexparser.load(bibtex_file, parser=parser)
+        # explicit utf-8 avoids locale-dependent decoding, and the larger buffer cuts
+        # read syscalls on multi-MB exports
+        with open(infile, "rt", encoding="utf-8", buffering=1 << 20) as bibtex_file:
+            bibtex_text = bibtex_file.read()
+
+        cursor = self.db.cursor()
+        existing_md5s = self.get_md5s(cursor)
+
+        # cheap pre-scan to avoid re-parsing entries that are already present in the
+        # collection; entries the scan cannot confidently match are kept and
+        # deduplicated after parsing, as before
+        bibtex_text, num_skipped = self._prefilter_bibtex(bibtex_text, existing_md5s)
+
+        if num_skipped > 0:
+            self._logger.info("Skipping %s entries already present in collection", num_skipped)
+
+        parser = BibTexParser(common_strings = True)
+        bibtex = bibtexparser.loads(bibtex_text, parser=parser)
 
         articles = bibtex.entries
 
@@ -381,17 +596,17 @@ class LitWalk:
                               num_removed)
 
         # compute md5 hash for each article title + abstract
-        for article in articles:
-            title = article.get("title", "")
-            abstract = article.get("abstract", "")
+        if len(articles) >= _HASH_PARALLEL_MIN:
+            from concurrent.futures import ThreadPoolExecutor
 
-            hash_input = (title + abstract).encode("utf-8")
-            article['md5'] = hashlib.md5(hash_input).hexdigest()
+            with ThreadPoolExecutor() as pool:
+                for article, md5 in zip(articles, pool.map(_article_md5, articles, chunksize=64)):
+                    article['md5'] = md5
+        else:
+            for article in articles:
+                article['md5'] = _article_md5(article)
 
         # exclude articles already present in the db
-        cursor = self.db.cursor()
-        existing_md5s = self.get_md5s(cursor)
-
         num_before = len(articles)
         articles = [x for x in articles if x['md5'] not in existing_md5s]
         num_after = len(articles)
@@ -400,9 +615,12 @@ class LitWalk:
             num_removed = num_before - num_after
             self._logger.warn("Excluding %s articles already present in collection", num_removed)
 
-        # determine note path to use for article
+        # determine note path to use for article; existing paths are fetched once and
+        # all collision checks run against the in-memory set
+        existing_notes = {x[0] for x in cursor.execute("SELECT note FROM articles")}
+
         for article in articles:
-            article["note"] = self._get_note_path(article, cursor)
+            article["note"] = self._get_note_path(article, existing_notes)
 
         # drop any articles that already exist in the database;
         # in the future, may be useful to support _updating_ existing entries..
@@ -415,6 +633,42 @@ class LitWalk:
 
         cursor.close()
 
+    def _prefilter_bibtex(self, bibtex_text:str, existing_md5s:set[str]) -> tuple[str, int]:
+        """
+        Removes raw bibtex entry blocks whose title + abstract already hash to an md5sum
+        present in the collection, so that unchanged entries are not re-parsed.
+
+        The scan is conservative: any block whose title/abstract cannot be extracted with
+        a simple regex is kept, and the post-parse md5 check remains the authoritative
+        duplicate filter.
+        """
+        if len(existing_md5s) == 0:
+            return bibtex_text, 0
+
+        kept = []
+        num_skipped = 0
+
+        for block in _BIB_ENTRY_SPLIT_RE.split(bibtex_text):
+            if block.startswith("@"):
+                title = _BIB_TITLE_RE.search(block)
+                abstract = _BIB_ABSTRACT_RE.search(block)
+
+                if title is not None or abstract is not None:
+                    # mimic bibtexparser's continuation-line handling so that the hash
+                    # matches the one computed from the parsed fields
+                    parts = [_BIB_CONT_WS_RE.sub("\n", x.group(1)).strip()
+                             for x in (title, abstract) if x is not None]
+
+                    md5 = hashlib.md5("".join(parts).encode("utf-8")).hexdigest()
+
+                    if md5 in existing_md5s:
+                        num_skipped += 1
+                        continue
+
+            kept.append(block)
+
+        return "".join(kept), num_skipped
+
     def add_articles(self, articles:list[dict[str, str]], cursor:sqlite3.Cursor):
         """
         Adds one or more articles to the users collection
@@ -428,76 +682,109 @@ class LitWalk:
                   "booktitle", "edition", "entrytype", "journal", "keywords", "pages", "author",
                   "volume", "number", "url", "year", "month", "md5"]
 
+        entries = []
+
         for article in articles:
             entry = {k: None for k in fields}
             captured_fields = {k: article[k] for k in fields if k in article}
 
             entry.update(captured_fields)
 
-            # strip newlines from title, abstract, keywords, etc.
+            # strip newlines/tabs from title, abstract, keywords, etc. in a single pass
             for field in ['title', 'abstract', 'author', 'keywords']:
                 if entry[field] is not None:
-                    entry[field] = entry[field].replace("\n", " ")
+                    entry[field] = entry[field].translate(_WS_TABLE)
+
+            entries.append(entry)
+
+        # normalize keywords;
+        # for now, store all keywords as lowercase (better for matching in article
+        # abstracts, etc.), and exclude keywords that contain a "/", possibly
+        # corresponding to a path in paperpile (this can be made optional, in the future..)
+        if len(entries) >= _KEYWORD_VECTORIZE_MIN:
+            # for larger imports, pandas' vectorized string ops are significantly faster
+            # than the equivalent per-article loop
+            self._normalize_keywords_batch(entries)
+        else:
+            for entry in entries:
+                if entry['keywords'] is not None:
+                    entry['keywords'] = "; ".join(
+                        k for k in (kw.strip().lower() for kw in entry['keywords'].split(";"))
+                        if k and "/" not in k)
 
-            # extract keywords;
-            if entry['keywords'] is not None:
-                keywords = []
+        # insert all entries within a single transaction, so the commit (and its fsync)
+        # happens once per batch instead of once per article; executemany amortizes the
+        # per-row statement dispatch, and binding by name avoids a tuple realloc per row
+        cursor.execute("BEGIN")
 
-                for keyword in entry['keywords'].split(";"):
-                    # for now, store all keywords as lowercase (better for matching
-                    # in article abstracts, etc.)
-                    keyword = keyword.strip().lower()
+        num_inserted = 0
 
-                    # exclude keywords that contain a "/", possibly corresponding to a path in
-                    # paperpile (this can be made optional, in the future..)
-                    if "/" not in keyword:
-                        keywords.append(keyword)
+        try:
+            for i in range(0, len(entries), _INSERT_CHUNK_SIZE):
+                cursor.executemany(_INSERT_ARTICLE_SQL, entries[i:i + _INSERT_CHUNK_SIZE])
+                num_inserted += cursor.rowcount
 
-                entry['keywords'] = "; ".join(keywords)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
-            self.add_article(cursor, tuple(entry.values()))
+        # rows rejected by the unique md5 index (INSERT OR IGNORE) are duplicates that
+        # slipped past the python-side pre-checks
+        if num_inserted < len(entries):
+            self._logger.warn("Excluding %s articles already present in collection",
+                              len(entries) - num_inserted)
+
+        self._num_articles_cache = None
+        self._version += 1
 
         self._logger.info("Finished!")
 
-    def add_article(self, cursor:sqlite3.Cursor, article:tuple[str]):
+    def _normalize_keywords_batch(self, entries:list[dict[str, Any]]):
+        """
+        Vectorized equivalent of the per-article keyword normalization, used for larger
+        imports; modifies `entries` in-place.
+        """
+        import pandas as pd
+
+        keywords = pd.Series([x['keywords'] for x in entries])
+
+        tokens = keywords.dropna().str.split(";").explode().str.strip().str.lower()
+        tokens = tokens[(tokens != "") & ~tokens.str.contains("/", regex=False)]
+
+        joined = tokens.groupby(level=0).agg("; ".join)
+
+        for i, entry in enumerate(entries):
+            if entry['keywords'] is not None:
+                entry['keywords'] = joined.get(i, "")
+
+    def add_article(self, cursor:sqlite3.Cursor, article:dict[str, Any]):
         """
         Adds a single article to a user's collection
+
+        article: dict
+            Article field dict containing every column named in the INSERT statement
         """
-        sql = '''INSERT INTO articles(doi, isbn, issn, pmc, pmid, arxivid, title, abstract, note,
-                                      booktitle, edition, entrytype, journal, keywords, pages,
-                                      author, volume, number, url, year, month, md5)
-                    VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
-        cursor.execute(sql, article)
+        cursor.execute(_INSERT_ARTICLE_SQL, article)
 
-        self.db.commit()
+        self._num_articles_cache = None
+        self._version += 1
 
     def info(self) -> dict[str,Any]:
         """
         Returns basic information about user article collection
         """
-        # determine how many articles are missing doi/absract/keywords
-        cursor = self.db.cursor()
-
-        # count # articles with missing DOIs
-        sql = "SELECT COUNT(*) FROM articles WHERE doi IS NULL"
-        missing_doi = cursor.execute(sql).fetchall()[0][0]
-
-        # count # articles with missing abstracts
-        sql2 = "SELECT COUNT(*) FROM articles WHERE abstract IS NULL"
-        missing_abstract = cursor.execute(sql2).fetchall()[0][0]
-
-        # count # articles with missing keywords
-        sql3 = "SELECT COUNT(*) FROM articles WHERE keywords IS NULL"
-        missing_keywords = cursor.execute(sql3).fetchall()[0][0]
-
-        cursor.close()
+        # determine how many articles are missing doi/absract/keywords; all four counts
+        # are computed in a single pass over the table
+        num_articles, missing_doi, missing_abstract, missing_keywords = \
+            self.db.execute(_INFO_COUNTS_SQL).fetchone()
 
         return {
-            "num_articles": self.num_articles(),
+            "num_articles": num_articles,
             "missing": {
-                "doi": missing_doi,
-                "abstract": missing_abstract,
-                "keywords": missing_keywords
+                "doi": missing_doi or 0,
+                "abstract": missing_abstract or 0,
+                "keywords": missing_keywords or 0
             }
         }
 
@@ -505,25 +792,24 @@ class LitWalk:
         """
         Returns the number of articles present in the user's collection
         """
-        cursor = self.db.cursor()
+        if self._num_articles_cache is None:
+            sql = "SELECT COUNT(id) FROM articles;"
 
-        sql = "SELECT COUNT(id) FROM articles;"
-
-        if self.dev_mode:
-            sql += f" LIMIT {self.dev_mode_subsample}"
-
-        cursor.execute(sql)
-        num_articles = cursor.fetchall()[0][0]
+            if self.dev_mode:
+                sql += f" LIMIT {self.dev_mode_subsample}"
 
-        cursor.close()
+            self._num_articles_cache = self.db.execute(sql).fetchone()[0]
 
-        return num_articles
+        return self._num_articles_cache
 
-    def _get_note_path(self, article:dict[str, str], cursor:sqlite3.Cursor) -> str:
+    def _get_note_path(self, article:dict[str, str], existing_notes:set[str]) -> str:
         """
         Determines path to use for markdown note associated with an article
 
         Path: <first author initial>/<first author><year>_<title><optional multiple suffix>
+
+        Collision checks are performed against `existing_notes`, which is also updated
+        with the chosen path so that later articles in the same batch collide correctly.
         """
         year = article.get("year", "")
         title = article.get("title", "")
@@ -537,10 +823,9 @@ class LitWalk:
             path = f"{year}_{title}"
 
         # replace spaces with underscores and ensure that string is a valid filepath
-        # adapted from: https://github.com/django/django/blob/main/django/utils/text.py
         path = str(path).strip().replace(" ", "_")
         path = path.replace("\n", "_")
-        path = re.sub(r"(?u)[^-\w.]", "", path)
+        path = _SLUG_RE.sub("", path)
 
         # add sub-directory prefix
         path = os.path.join(dir_, path)
@@ -549,18 +834,16 @@ class LitWalk:
         path = path + ".md"
 
         # add suffix if an article already exists with the same path
-        cursor.execute(f'SELECT COUNT(id) FROM articles WHERE note="{path}";')
-        num_matches = cursor.fetchall()[0][0]
-
-        i = 0
+        if path in existing_notes:
+            stem = _MD_EXT_RE.sub("", path)
 
-        while num_matches > 0:
-            alt_path = re.sub(r"\.md$", string.ascii_lowercase[i] + ".md", path)
+            for suffix in string.ascii_lowercase:
+                alt_path = f"{stem}{suffix}.md"
 
-            cursor.execute(f'SELECT COUNT(id) FROM articles WHERE note="{alt_path}";')
-            num_matches = cursor.fetchall()[0][0]
+                if alt_path not in existing_notes:
+                    path = alt_path
+                    break
 
-            if num_matches == 0:
-                path = alt_path
+        existing_notes.add(path)
 
         return path
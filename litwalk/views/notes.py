@@ -3,7 +3,9 @@ lit-walk "notes" view
 """
 from __future__ import annotations
 
+import bisect
 import os
+import re
 import sys
 from typing import Any
 import click
@@ -19,6 +21,13 @@ from textual import events
 from textual.reactive import reactive
 from textual_autocomplete._autocomplete import AutoComplete, DropdownItem, Dropdown
 
+# max number of dropdown matches collected per keystroke; the dropdown only ever
+# displays a handful, so collecting (and rendering) more is wasted work
+_MAX_MATCHES = 100
+
+# translation table used to strip "{"/"}" from titles in a single pass
+_BRACE_TBL = str.maketrans("", "", "{}")
+
 class NotesView(App):
     """
     Notes View Textual App class definition
@@ -39,21 +48,34 @@ class NotesView(App):
         self._articles = articles
         self._notes_dir = notes_dir
 
-        # create a list of article ids with existing notes
-        self._existing_ids:list[str] = []
+        # build the set of existing note files with a single directory walk, rather
+        # than one stat call per article
+        existing_notes:set[str] = set()
+
+        for dirpath, _, filenames in os.walk(self._notes_dir):
+            reldir = os.path.relpath(dirpath, self._notes_dir)
+
+            for filename in filenames:
+                existing_notes.add(os.path.normpath(os.path.join(reldir, filename)))
+
+        # create a set of article ids with existing notes; _update_select_opts tests
+        # membership once per article, so O(1) lookups matter here
+        self._existing_ids:set[str] = set()
 
         for article in self._articles:
-            note_path = os.path.join(self._notes_dir, article["note"])
-            if os.path.exists(note_path):
-                self._existing_ids.append(article["id"])
+            if article["note"] in existing_notes:
+                self._existing_ids.add(article["id"])
 
-        # create and store DropdownItem instances, indexed by article id
+        # create and store DropdownItem instances, indexed by article id, along with a
+        # cleaned-title -> article mapping used to resolve selections in O(1)
         self._dropdown_items = {}
+        self._title_to_article:dict[str, dict[str, Any]] = {}
 
         for article in articles:
             # ignore "{" and "}" when searching titles
-            article_title = article["title"].replace("{", "").replace("}", "")
+            article_title = article["title"].translate(_BRACE_TBL)
             self._dropdown_items[article["id"]] = DropdownItem(article_title)
+            self._title_to_article[article_title] = article
 
         # set initial select options to include all articles
         self._update_select_opts()
@@ -71,7 +93,20 @@ class NotesView(App):
                 if article_id in self._existing_ids:
                     self._items.append(dropdown_item)
         else:
-            self._items = self._dropdown_items.values()
+            self._items = list(self._dropdown_items.values())
+
+        # precompute lowercased titles once per option change, so per-keystroke
+        # filtering doesn't re-lowercase every title
+        self._items_lc = [item.main.plain.lower() for item in self._items]
+
+        # titles sorted alongside their items, so left-anchored matches can be located
+        # with bisect in O(log N + k) rather than scanning every title
+        self._sorted_pairs = sorted(zip(self._items_lc, self._items), key=lambda pair: pair[0])
+        self._sorted_keys = [pair[0] for pair in self._sorted_pairs]
+
+        # per-query match cache; bursts of keystrokes frequently revisit the same query
+        # (backspace/retype), and the checkbox toggle re-fires the current one
+        self._match_cache:dict[str, list[DropdownItem]] = {}
 
         self.num_articles = len(self._items)
 
@@ -90,7 +125,13 @@ class NotesView(App):
 
     def on_checkbox_changed(self) -> None:
         """Event handler for existing only checkbox toggle"""
-        self.existing_only = not self.existing_only
+        val = self.query_one("#toggle-existing").value
+
+        # ignore events that don't actually change the filter state
+        if val == self.existing_only:
+            return
+
+        self.existing_only = val
         self._update_select_opts()
 
         # force refresh of downdown options currently displayed
@@ -106,24 +147,26 @@ class NotesView(App):
     def on_auto_complete_selected(self, event: AutoComplete.Selected) -> None:
         """Item selection event handler"""
         # open matched article in editor (for now, assumes unique title..)
-        for article in self._articles:
-            article_title = article["title"].replace("{", "").replace("}", "")
+        article_title = event.item.main.plain
+        article = self._title_to_article.get(article_title)
+
+        if article is None:
+            return
 
-            if article_title == event.item.main.plain:
-                note_path = os.path.join(self._notes_dir, article["note"])
+        note_path = os.path.join(self._notes_dir, article["note"])
 
-                # create directory if needed
-                if not os.path.exists(os.path.dirname(note_path)):
-                    os.mkdir(os.path.dirname(note_path), mode=0o755)
+        # create directory if needed
+        if not os.path.exists(os.path.dirname(note_path)):
+            os.mkdir(os.path.dirname(note_path), mode=0o755)
 
-                # if file doesn't exist, create and add title;
-                # later, this can be extended with a more useful template..
-                if not os.path.exists(note_path):
-                    with open(note_path, "wt", encoding="utf-8") as fp:
-                        fp.write(f"# {article_title}\n")
+        # if file doesn't exist, create and add title;
+        # later, this can be extended with a more useful template..
+        if not os.path.exists(note_path):
+            with open(note_path, "wt", encoding="utf-8") as fp:
+                fp.write(f"# {article_title}\n")
 
-                click.edit(filename=note_path)
-                self.exit()
+        click.edit(filename=note_path)
+        self.exit()
 
     def on_mount(self) -> None:
         """
@@ -138,13 +181,36 @@ class NotesView(App):
 
         # auto complete match func
         def get_items(value: str, cursor_position: int) -> list[DropdownItem]:
-            # get matching articles
-            matches = [c for c in self._items if value.lower() in c.main.plain.lower()]
+            value_lc = value.lower()
+
+            cached = self._match_cache.get(value_lc)
+
+            if cached is not None:
+                return cached
+
+            # left-anchored matches first, located via bisect on the sorted title index
+            lo = bisect.bisect_left(self._sorted_keys, value_lc)
+            hi = bisect.bisect_right(self._sorted_keys, value_lc + "\uffff", lo=lo)
+
+            matches = [pair[1] for pair in self._sorted_pairs[lo:min(hi, lo + _MAX_MATCHES)]]
+
+            # followed by interior substring matches, until the cap is reached; the
+            # query is compiled once per keystroke and scanned in the C regex engine.
+            # a match at position 0 is a prefix hit already collected above
+            pattern = re.compile(re.escape(value_lc))
+
+            for i, title in enumerate(self._items_lc):
+                if len(matches) >= _MAX_MATCHES:
+                    break
+
+                match = pattern.search(title)
+
+                if match is not None and match.start() > 0:
+                    matches.append(self._items[i])
 
-            # prioritize left-anchored matches
-            ordered = sorted(matches, key=lambda v: v.main.plain.startswith(value.lower()))
+            self._match_cache[value_lc] = matches
 
-            return ordered
+            return matches
 
         yield Static("lit-walk / notes", id="title-text")
         yield Horizontal(
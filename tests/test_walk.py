@@ -0,0 +1,78 @@
+"""
+Test stochastic article suggestion functionality
+"""
+import os
+import tempfile
+import pytest
+from litwalk import LitWalk
+
+TEST_DATA_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "data")
+
+@pytest.fixture
+def lw():
+    """Creates a simple litwalk instance to use for testing"""
+    data_dir = tempfile.mkdtemp()
+    notes_dir = tempfile.mkdtemp()
+
+    lw = LitWalk(data_dir, notes_dir)
+    lw.import_bibtex(os.path.join(TEST_DATA_DIR, "bib", "paperpile.bib"))
+
+    return lw
+
+@pytest.fixture
+def lw_network():
+    """Creates a litwalk instance with one token-level and one interior-only match for
+    the search term "network" """
+    data_dir = tempfile.mkdtemp()
+    notes_dir = tempfile.mkdtemp()
+
+    lw = LitWalk(data_dir, notes_dir)
+    lw.import_bibtex(os.path.join(TEST_DATA_DIR, "bib", "network.bib"))
+
+    return lw
+
+def test_walk_search_partial_word(lw):
+    """
+    Test that partial-word searches match, as they did with the original LIKE scan
+    """
+    res = lw.walk("learn")
+
+    assert res["num_included"] >= 1
+    assert res["article"] is not None
+    assert "learn" in (res["article"]["title"] + res["article"]["abstract"]).lower()
+
+def test_walk_search_interior_substring(lw):
+    """
+    Test that searches matching the interior of a word (e.g. "network" in
+    "subnetworks") still work
+    """
+    res = lw.walk("network")
+
+    assert res["num_included"] >= 1
+
+def test_walk_search_token_and_interior(lw_network):
+    """
+    Test that a search matching one article at the token level and another only as an
+    interior substring counts and can choose both
+    """
+    res = lw_network.walk("network")
+
+    assert res["num_included"] == 2
+
+    # both articles should be reachable from repeated walks
+    titles = set()
+
+    for _ in range(100):
+        titles.add(lw_network.walk("network")["article"]["title"])
+
+        if len(titles) == 2:
+            break
+
+    assert len(titles) == 2
+
+def test_walk_search_no_match(lw):
+    """
+    Test that a search matching no articles raises instead of returning a result
+    """
+    with pytest.raises(Exception, match="No matching articles found!"):
+        lw.walk("xyzzy-no-such-term")